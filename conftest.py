@@ -1,8 +1,10 @@
 """
 Pytest configuration and fixtures for Playwright tests
 """
+import os
 import sys
 import platform
+import allure
 import pytest
 from pathlib import Path
 from playwright.sync_api import Playwright, Browser, BrowserContext, Page
@@ -81,9 +83,63 @@ def create_allure_environment_file():
         f.write("Base URL=\n")
 
 
+def _is_xdist_worker(config) -> bool:
+    """Check if running inside a pytest-xdist worker process"""
+    return hasattr(config, "workerinput")
+
+
+# Values accepted by HABR_PAGE_SCOPE
+_PAGE_SCOPES = ("function", "session")
+
+
+def _page_scope(fixture_name, config) -> str:
+    """
+    Scope of the context/page/steps fixtures
+    
+    'function' (default) gives every test a fresh page; HABR_PAGE_SCOPE=session reuses one
+    page per worker and skips reloading the main page between tests.
+    """
+    scope = os.getenv("HABR_PAGE_SCOPE", "function")
+    if scope not in _PAGE_SCOPES:
+        raise pytest.UsageError(
+            f"Invalid HABR_PAGE_SCOPE value '{scope}', expected one of: {', '.join(_PAGE_SCOPES)}"
+        )
+    return scope
+
+
+@pytest.hookimpl(tryfirst=True)
 def pytest_configure(config):
     """Pytest configuration hook - called before test collection"""
-    create_allure_environment_file()
+    # Fail on a mistyped HABR_PAGE_SCOPE before collection, not at the first fixture setup
+    _page_scope(None, config)
+    if _is_xdist_worker(config):
+        # Only the controller cleans allure-results, workers would remove each other's results
+        config.option.clean_alluredir = False
+
+
+def pytest_sessionstart(session):
+    """Session start hook - write Allure environment file once, after allure-results is cleaned"""
+    if not _is_xdist_worker(session.config):
+        create_allure_environment_file()
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    """Attach a page screenshot to Allure when a test fails"""
+    outcome = yield
+    report = outcome.get_result()
+    if report.when == "call" and report.failed:
+        page = item.funcargs.get("page")
+        if page is not None:
+            try:
+                allure.attach(
+                    page.screenshot(type="jpeg", quality=60),
+                    name="failure_screenshot",
+                    attachment_type=allure.attachment_type.JPG
+                )
+            except Exception:
+                # Page may already be closed or crashed
+                pass
 
 
 @pytest.fixture(scope="session")
@@ -113,10 +169,10 @@ def browser(playwright: Playwright) -> Browser:
     browser.close()
 
 
-@pytest.fixture(scope="function")
+@pytest.fixture(scope=_page_scope)
 def browser_context(browser: Browser) -> BrowserContext:
     """
-    Browser context fixture (new context for each test)
+    Browser context fixture (new context for each test, see _page_scope)
     
     Args:
         browser: Browser instance
@@ -132,10 +188,10 @@ def browser_context(browser: Browser) -> BrowserContext:
     context.close()
 
 
-@pytest.fixture(scope="function")
+@pytest.fixture(scope=_page_scope)
 def page(browser_context: BrowserContext) -> Page:
     """
-    Page fixture (new page for each test)
+    Page fixture (new page for each test, see _page_scope)
     
     Args:
         browser_context: BrowserContext instance
@@ -148,21 +204,33 @@ def page(browser_context: BrowserContext) -> Page:
     page.close()
 
 
-@pytest.fixture(scope="function")
-def main_page_steps(page: Page) -> MainPageSteps:
+@pytest.fixture(scope="session")
+def screenshot_cache() -> dict:
+    """
+    Screenshot cache fixture (shared across all tests of a worker)
+    
+    Returns:
+        Dictionary of element screenshots keyed by name and element fingerprint
+    """
+    return {}
+
+
+@pytest.fixture(scope=_page_scope)
+def main_page_steps(page: Page, screenshot_cache: dict) -> MainPageSteps:
     """
     MainPageSteps fixture (provides steps instance for each test)
     
     Args:
         page: Page instance
+        screenshot_cache: Session screenshot cache
         
     Returns:
         MainPageSteps instance
     """
-    return MainPageSteps(page)
+    return MainPageSteps(page, screenshot_cache)
 
 
-@pytest.fixture(scope="function")
+@pytest.fixture(scope=_page_scope)
 def login_page_steps(page: Page) -> LoginPageSteps:
     """
     LoginPageSteps fixture (provides steps instance for each test)
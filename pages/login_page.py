@@ -1,6 +1,7 @@
 """
 Page Object Model for Habr.com login page/modal
 """
+from types import MappingProxyType
 from playwright.sync_api import Page, Locator
 from typing import Dict
 
@@ -8,6 +9,20 @@ from typing import Dict
 class LoginPage:
     """Page Object Model for Habr.com login modal/window"""
     
+    # Social login button names mapped to the names of their icons (see get_all_social_login_icons)
+    SOCIAL_BUTTON_ICONS = MappingProxyType({
+        f"Войти с помощью {provider}": provider
+        for provider in ("GitHub", "VK", "Google", "Facebook", "Twitter", "Yandex")
+    })
+    
+    # Raw CSS selectors for in-page batch probing of the social login buttons, relative to
+    # social_buttons_block: {button name: (css, text, icon css)}. They mirror the has_text
+    # fallbacks of the button locators and the generic part of the icon locators below.
+    SOCIAL_BUTTON_SELECTORS = MappingProxyType({
+        button_name: ("button, a", provider, "img, svg")
+        for button_name, provider in SOCIAL_BUTTON_ICONS.items()
+    })
+    
     def __init__(self, page: Page):
         """
         Initialize LoginPage with Playwright page object
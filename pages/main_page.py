@@ -1,7 +1,68 @@
 """
 Page Object Model for Habr.com main page
 """
-from playwright.sync_api import Page, Locator
+import os
+from types import MappingProxyType
+from playwright.sync_api import Page, Locator, Error as PlaywrightError, TimeoutError as PlaywrightTimeoutError
+
+
+# Script evaluated in the page to probe many elements in a single round-trip.
+# Takes {name: [css, text]} and returns {name: {visible, enabled}} for the first
+# element matching css whose text contains text (any matching element if text is null).
+# A spec [css, text, child_css] also reports childVisible for the element's first
+# descendant matching child_css (e.g. the icon inside a button).
+# Evaluated on a locator, the search is limited to that element's subtree.
+# Visibility follows Playwright's rule: non-empty bounding box and visibility "visible".
+BATCH_PROBE_SCRIPT = """
+(...args) => {
+    const [root, specs] = args.length > 1 ? args : [document, args[0]];
+    const isVisible = (el) => {
+        const rect = el.getBoundingClientRect();
+        return rect.width > 0 && rect.height > 0
+            && getComputedStyle(el).visibility === 'visible';
+    };
+    const isEnabled = (el) => !el.disabled && !el.closest('[aria-disabled="true"]');
+    const results = {};
+    for (const [name, [css, text, childCss]] of Object.entries(specs)) {
+        const el = Array.from(root.querySelectorAll(css))
+            .find((candidate) => !text || candidate.textContent.includes(text));
+        results[name] = {
+            visible: !!el && isVisible(el),
+            enabled: !!el && isEnabled(el)
+        };
+        if (childCss) {
+            const child = el && el.querySelector(childCss);
+            results[name].childVisible = !!child && isVisible(child);
+        }
+    }
+    return results;
+}
+"""
+
+# Script evaluated on a single element: same visibility/enabled rules as BATCH_PROBE_SCRIPT
+ELEMENT_STATE_SCRIPT = """
+(el) => {
+    const rect = el.getBoundingClientRect();
+    return {
+        visible: rect.width > 0 && rect.height > 0 && getComputedStyle(el).visibility === 'visible',
+        enabled: !el.disabled && !el.closest('[aria-disabled="true"]')
+    };
+}
+"""
+
+# Timeouts (ms): FAST bounds the in-page evaluate probes (is_visible() does not wait and takes
+# no effective timeout), SLOW is used for waits the test flow depends on
+FAST_TIMEOUT = int(os.getenv("HABR_FAST_TIMEOUT", "500"))
+SLOW_TIMEOUT = 5000
+
+HEADER_CONTAINER_CSS = "div.tm-header__container"
+FOOTER_MENU_CONTAINER_CSS = "div.tm-footer-menu__container"
+FOOTER_SECTION_MAIN_CSS = "div.tm-footer"
+
+
+def _text_selectors(css: str, names: tuple) -> MappingProxyType:
+    """Build {name: (css, name)} batch-probe selectors for elements located by their text"""
+    return MappingProxyType({name: (css, name) for name in names})
 
 
 class MainPage:
@@ -9,6 +70,65 @@ class MainPage:
     
     URL = "https://habr.com"
     
+    # Raw CSS selectors for in-page batch probing: {name: (css, text)}.
+    # They mirror the CSS part of the locators below; elements that are only
+    # reachable via role/text locators are re-checked with Playwright on a miss.
+    CONTENT_TAB_SELECTORS = MappingProxyType({
+        "Статьи": ('a[href="/ru/articles/"]', "Статьи"),
+        "Посты": ('a[href="/ru/posts/"]', "Посты"),
+        "Новости": ('a[href="/ru/news/"]', "Новости"),
+        "Хабы": ('a[href="/ru/hubs/"]', "Хабы"),
+        "Авторы": ('a[href="/ru/users/"]', "Авторы"),
+        "Компании": ('a[href="/ru/companies/"]', "Компании")
+    })
+    
+    # Links and buttons are probed separately, like their role-based locators
+    HEADER_ELEMENT_SELECTORS = MappingProxyType({
+        **_text_selectors(f"{HEADER_CONTAINER_CSS} a", ("Все потоки", "Поиск", "Написать публикацию")),
+        **_text_selectors(f"{HEADER_CONTAINER_CSS} button", ("Настройки", "Войти"))
+    })
+    
+    LOGO_SELECTOR = (f'{HEADER_CONTAINER_CSS} a[href*="/ru/feed"], {HEADER_CONTAINER_CSS} a[href="/"]', None)
+    
+    FOOTER_TITLE_SELECTORS = _text_selectors(
+        f"{FOOTER_MENU_CONTAINER_CSS} p.tm-footer-menu__block-title",
+        ("Ваш аккаунт", "Разделы", "Информация", "Услуги")
+    )
+    
+    FOOTER_OPTION_SELECTORS = MappingProxyType({
+        'account': _text_selectors(f"{FOOTER_MENU_CONTAINER_CSS} a", (
+            "Войти", "Регистрация"
+        )),
+        'sections': _text_selectors(f"{FOOTER_MENU_CONTAINER_CSS} a", (
+            "Статьи", "Новости", "Хабы", "Компании", "Авторы", "Песочница"
+        )),
+        'information': _text_selectors(f"{FOOTER_MENU_CONTAINER_CSS} a", (
+            "Устройство сайта", "Для авторов", "Для компаний",
+            "Документы", "Соглашение", "Конфиденциальность"
+        )),
+        'services': _text_selectors(f"{FOOTER_MENU_CONTAINER_CSS} a", (
+            "Корпоративный блог", "Медийная реклама", "Нативные проекты",
+            "Образовательные программы", "Стартапам"
+        ))
+    })
+    
+    # Relative to menu_options_container
+    MENU_OPTION_SELECTORS = _text_selectors("a", (
+        "Что нового", "Бэкенд", "Фронтенд", "Администрирование", "Дизайн",
+        "Менеджмент", "Маркетинг и контент", "Научпоп", "Разработка", "Все потоки"
+    ))
+    
+    # Relative to menu_options_container
+    SERVICE_LINK_SELECTORS = _text_selectors("a", ("Хабр", "Q&A", "Карьера", "Курсы"))
+    
+    # Relative to social_icons_container
+    SOCIAL_ICON_SELECTORS = MappingProxyType({
+        "VK": ('a[href*="vk.com"], a[href*="vk.ru"]', None),
+        "Telegram": ('a[href*="t.me"], a[href*="telegram"]', None),
+        "Youtube": ('a[href*="youtube.com"], a[href*="youtu.be"]', None),
+        "Dzen": ('a[href*="dzen.ru"]', None)
+    })
+    
     def __init__(self, page: Page):
         """
         Initialize MainPage with Playwright page object
@@ -17,33 +137,36 @@ class MainPage:
             page: Playwright Page instance
         """
         self.page = page
+        # Popup banner locators are used on every close_popup_banner call, build them once
+        self.banner = page.locator('div.fixed-banner-wrapper')
+        self.banner_close = page.locator('button.close-button')
     
     def navigate(self) -> None:
         """Navigate to the main page"""
         self.page.goto(self.URL, wait_until="domcontentloaded")
         # Wait for header container to be visible as an indicator that page is loaded
-        self.page.wait_for_selector("div.tm-header__container", state="visible", timeout=30000)
+        self.page.wait_for_selector(HEADER_CONTAINER_CSS, state="visible", timeout=30000)
         # Wait for page to be fully loaded (all resources loaded) with increased timeout
         try:
             self.page.wait_for_load_state("load", timeout=30000)
-        except Exception:
+        except PlaywrightTimeoutError:
             # If load state times out, try networkidle as fallback
             try:
                 self.page.wait_for_load_state("networkidle", timeout=15000)
-            except Exception:
+            except PlaywrightTimeoutError:
                 # If both fail, just continue - page is likely loaded enough
                 pass
         # If we're on feed page, navigate to articles page where all tabs are visible
         if "/ru/feed" in self.page.url:
             self.page.goto("https://habr.com/ru/articles/", wait_until="domcontentloaded")
-            self.page.wait_for_selector("div.tm-header__container", state="visible", timeout=30000)
+            self.page.wait_for_selector(HEADER_CONTAINER_CSS, state="visible", timeout=30000)
             try:
                 self.page.wait_for_load_state("load", timeout=30000)
-            except Exception:
+            except PlaywrightTimeoutError:
                 # If load state times out, try networkidle as fallback
                 try:
                     self.page.wait_for_load_state("networkidle", timeout=15000)
-                except Exception:
+                except PlaywrightTimeoutError:
                     # If both fail, just continue - page is likely loaded enough
                     pass
     
@@ -51,7 +174,7 @@ class MainPage:
     @property
     def header_container(self) -> Locator:
         """Header container element"""
-        return self.page.locator("div.tm-header__container")
+        return self.page.locator(HEADER_CONTAINER_CSS)
     
     @property
     def logo_link(self) -> Locator:
@@ -132,6 +255,27 @@ class MainPage:
         """Footer section"""
         return self.page.locator('.tm-footer-menu')
     
+    def get_all_content_tabs(self) -> dict:
+        """Get dictionary of all content tab locators"""
+        return {
+            "Статьи": self.articles_tab,
+            "Посты": self.posts_tab,
+            "Новости": self.news_tab,
+            "Хабы": self.hubs_tab,
+            "Авторы": self.authors_tab,
+            "Компании": self.companies_tab
+        }
+    
+    def get_all_header_elements(self) -> dict:
+        """Get dictionary of header element locators (links and buttons)"""
+        return {
+            "Все потоки": self.all_streams_link,
+            "Поиск": self.search_link,
+            "Написать публикацию": self.write_publication_link,
+            "Настройки": self.settings_button,
+            "Войти": self.login_button
+        }
+    
     # Verification methods
     def verify_header_container_exists(self) -> bool:
         """Verify header container exists and is visible"""
@@ -160,6 +304,11 @@ class MainPage:
         """Menu panel element"""
         return self.page.locator(".navigation-wrapper")
     
+    @property
+    def menu_options_container(self) -> Locator:
+        """Container holding the main menu options"""
+        return self.menu_panel.first
+    
     # Main menu options
     @property
     def menu_whats_new(self) -> Locator:
@@ -274,18 +423,31 @@ class MainPage:
         """Verify menu button is clickable"""
         return self.menu_button.is_enabled()
     
+    def menu_button_state(self) -> dict:
+        """
+        Get menu button existence, visibility and enabled state in a single round-trip
+        
+        Returns:
+            dict: Dictionary with 'exists', 'visible' and 'enabled' status
+        """
+        try:
+            state = self.menu_button.evaluate(ELEMENT_STATE_SCRIPT, timeout=FAST_TIMEOUT)
+        except PlaywrightError:
+            return {"exists": False, "visible": False, "enabled": False}
+        return {"exists": True, **state}
+    
     def verify_menu_panel_displayed(self) -> bool:
         """Verify menu panel is displayed and visible"""
         try:
-            return self.menu_panel.is_visible(timeout=5000)
-        except Exception:
+            return self.menu_panel.is_visible()
+        except PlaywrightError:
             return False
     
     def verify_menu_panel_hidden(self) -> bool:
         """Verify menu panel is hidden or not displayed"""
         try:
-            return not self.menu_panel.is_visible(timeout=2000)
-        except Exception:
+            return not self.menu_panel.is_visible()
+        except PlaywrightError:
             return True
     
     def get_all_menu_options(self) -> dict:
@@ -316,12 +478,12 @@ class MainPage:
     @property
     def footer_menu_container(self) -> Locator:
         """Footer menu container"""
-        return self.page.locator('div.tm-footer-menu__container')
+        return self.page.locator(FOOTER_MENU_CONTAINER_CSS)
     
     @property
     def footer_section_main(self) -> Locator:
         """Main footer section (div.tm-footer)"""
-        return self.page.locator('div.tm-footer')
+        return self.page.locator(FOOTER_SECTION_MAIN_CSS)
     
     # Footer menu titles
     @property
@@ -466,6 +628,11 @@ class MainPage:
         # Look for a div or section that contains links to vk, telegram, youtube, or dzen
         return self.footer_section_main.locator('div:has(a[href*="vk.com"]), div:has(a[href*="t.me"]), div:has(a[href*="youtube"]), div:has(a[href*="dzen.ru"]), [class*="social-icons"], [class*="social"]').first
     
+    @property
+    def social_icons_container(self) -> Locator:
+        """Container holding the footer social icons"""
+        return self.footer_section_main.first
+    
     @property
     def footer_social_icon_vk(self) -> Locator:
         """VK social icon"""
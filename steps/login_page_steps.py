@@ -2,10 +2,16 @@
 Steps class for Login Page test actions
 Implements step-by-step actions for login functionality test execution
 """
-from pages.main_page import MainPage
+import os
+from pages.main_page import MainPage, BATCH_PROBE_SCRIPT, FAST_TIMEOUT, SLOW_TIMEOUT
 from pages.login_page import LoginPage
-from playwright.sync_api import Page
+from playwright.sync_api import Page, Locator
 import allure
+from utils.element_status import ElementStatus, ElementStatusMap
+
+
+# Per-step screenshots are opt-in; failures are still captured by the conftest report hook
+_SHOT = os.getenv("HABR_SCREENSHOT_ON_STEP", "0") == "1"
 
 
 class LoginPageSteps:
@@ -22,6 +28,41 @@ class LoginPageSteps:
         self.main_page = MainPage(page)
         self.login_page = LoginPage(page)
     
+    def _attach_screenshot(self, name: str, locator: Locator = None) -> None:
+        """
+        Attach a screenshot to the Allure report if per-step screenshots are enabled
+        
+        If the element cannot be captured, a note is attached and the visible page is captured instead.
+        
+        Args:
+            name: Attachment name
+            locator: Element to capture; the visible page is captured as JPEG if omitted
+        """
+        if not _SHOT:
+            return
+        if locator is not None:
+            try:
+                allure.attach(
+                    locator.screenshot(timeout=SLOW_TIMEOUT),
+                    name=name,
+                    attachment_type=allure.attachment_type.PNG
+                )
+                return
+            except Exception as e:
+                allure.attach(
+                    f"Screenshot of '{name}' failed - element may not be stable, using page screenshot. Error: {e}",
+                    name=f"{name}_screenshot_failed",
+                    attachment_type=allure.attachment_type.TEXT
+                )
+        try:
+            allure.attach(
+                self.page.screenshot(type="jpeg", quality=60),
+                name=name,
+                attachment_type=allure.attachment_type.JPG
+            )
+        except Exception:
+            pass
+    
     @allure.step("Verify login button exists, is visible, and clickable")
     def verify_login_button(self) -> dict:
         """
@@ -30,11 +71,13 @@ class LoginPageSteps:
         Returns:
             dict: Dictionary with 'exists', 'visible', and 'clickable' status
         """
+        login_button = self.main_page.login_button
+        first_button = login_button.first
         try:
-            exists = self.main_page.login_button.count() > 0
+            exists = login_button.count() > 0
             if exists:
-                visible = self.main_page.login_button.first.is_visible(timeout=5000)
-                clickable = self.main_page.login_button.first.is_enabled() if visible else False
+                visible = first_button.is_visible(timeout=5000)
+                clickable = first_button.is_enabled() if visible else False
             else:
                 visible = False
                 clickable = False
@@ -44,11 +87,7 @@ class LoginPageSteps:
             clickable = False
         
         if visible:
-            allure.attach(
-                self.main_page.login_button.first.screenshot(),
-                name="login_button",
-                attachment_type=allure.attachment_type.PNG
-            )
+            self._attach_screenshot("login_button", first_button)
         
         return {"exists": exists, "visible": visible, "clickable": clickable}
     
@@ -71,11 +110,7 @@ class LoginPageSteps:
                     # If all waits fail, just continue - modal might be visible already
                     pass
         
-        allure.attach(
-            self.page.screenshot(),
-            name="login_modal_opened",
-            attachment_type=allure.attachment_type.PNG
-        )
+        self._attach_screenshot("login_modal_opened")
     
     @allure.step("Verify login window is displayed")
     def verify_login_window_displayed(self) -> bool:
@@ -88,11 +123,7 @@ class LoginPageSteps:
         is_visible = self.login_page.verify_login_modal_exists()
         
         if is_visible:
-            allure.attach(
-                self.login_page.login_modal.screenshot(),
-                name="login_window",
-                attachment_type=allure.attachment_type.PNG
-            )
+            self._attach_screenshot("login_window", self.login_page.login_modal)
         else:
             allure.attach(
                 "Login window/modal is not visible",
@@ -117,11 +148,7 @@ class LoginPageSteps:
         results["Вход"] = {"visible": login_title_visible}
         
         if login_title_visible:
-            allure.attach(
-                self.login_page.login_title.screenshot(),
-                name="login_title",
-                attachment_type=allure.attachment_type.PNG
-            )
+            self._attach_screenshot("login_title", self.login_page.login_title)
         else:
             allure.attach(
                 "Login title 'Вход' is not visible",
@@ -134,11 +161,7 @@ class LoginPageSteps:
         results["Email_label"] = {"visible": email_label_visible}
         
         if email_label_visible:
-            allure.attach(
-                self.login_page.email_label.screenshot(),
-                name="email_label",
-                attachment_type=allure.attachment_type.PNG
-            )
+            self._attach_screenshot("email_label", self.login_page.email_label)
         else:
             allure.attach(
                 "Email label text is not visible",
@@ -151,11 +174,7 @@ class LoginPageSteps:
         results["Пароль_label"] = {"visible": password_label_visible}
         
         if password_label_visible:
-            allure.attach(
-                self.login_page.password_label.screenshot(),
-                name="password_label",
-                attachment_type=allure.attachment_type.PNG
-            )
+            self._attach_screenshot("password_label", self.login_page.password_label)
         else:
             allure.attach(
                 "Password label 'Пароль' is not visible",
@@ -189,25 +208,18 @@ class LoginPageSteps:
         Verify Login submit button and Forgot Password link are present, visible, and clickable
         
         Returns:
-            dict: Dictionary with button/link names as keys and dict with 'visible' and 'clickable' as values
+            ElementStatusMap: Dictionary with button/link names as keys and ElementStatus as values
         """
-        results = {}
+        results = ElementStatusMap()
         
         # Verify Login submit button
         login_button_visible = self.login_page.verify_login_submit_button_exists()
         login_button_clickable = self.login_page.verify_login_submit_button_clickable() if login_button_visible else False
         
-        results["Войти"] = {
-            "visible": login_button_visible,
-            "clickable": login_button_clickable
-        }
+        results["Войти"] = ElementStatus(login_button_visible, login_button_clickable)
         
         if login_button_visible:
-            allure.attach(
-                self.login_page.login_submit_button.screenshot(),
-                name="login_submit_button",
-                attachment_type=allure.attachment_type.PNG
-            )
+            self._attach_screenshot("login_submit_button", self.login_page.login_submit_button)
         else:
             allure.attach(
                 "Login submit button is not visible",
@@ -219,17 +231,10 @@ class LoginPageSteps:
         forgot_password_visible = self.login_page.verify_forgot_password_link_exists()
         forgot_password_clickable = self.login_page.verify_forgot_password_link_clickable() if forgot_password_visible else False
         
-        results["Забыли пароль?"] = {
-            "visible": forgot_password_visible,
-            "clickable": forgot_password_clickable
-        }
+        results["Забыли пароль?"] = ElementStatus(forgot_password_visible, forgot_password_clickable)
         
         if forgot_password_visible:
-            allure.attach(
-                self.login_page.forgot_password_link.screenshot(),
-                name="forgot_password_link",
-                attachment_type=allure.attachment_type.PNG
-            )
+            self._attach_screenshot("forgot_password_link", self.login_page.forgot_password_link)
         else:
             allure.attach(
                 "Forgot password link is not visible",
@@ -254,36 +259,7 @@ class LoginPageSteps:
         results["social_buttons_block"] = {"visible": social_buttons_block_visible}
         
         if social_buttons_block_visible:
-            try:
-                # Wait for element to be visible and stable before taking screenshot
-                social_buttons_block_locator = self.login_page.social_buttons_block
-                social_buttons_block_locator.wait_for(state="visible", timeout=10000)
-                # Take screenshot - element is already visible and stable
-                allure.attach(
-                    social_buttons_block_locator.screenshot(timeout=5000),
-                    name="social_buttons_block",
-                    attachment_type=allure.attachment_type.PNG
-                )
-            except Exception as e:
-                # If screenshot fails, try taking page screenshot as fallback
-                try:
-                    allure.attach(
-                        self.page.screenshot(timeout=3000),
-                        name="social_buttons_block_page_fallback",
-                        attachment_type=allure.attachment_type.PNG
-                    )
-                    allure.attach(
-                        f"Social buttons block screenshot failed, using page screenshot as fallback. Error: {str(e)}",
-                        name="social_buttons_block_screenshot_info",
-                        attachment_type=allure.attachment_type.TEXT
-                    )
-                except Exception:
-                    # If all screenshots fail, attach error message
-                    allure.attach(
-                        f"Social buttons block screenshot failed - element may not be stable. Error: {str(e)}",
-                        name="social_buttons_block_screenshot_failed",
-                        attachment_type=allure.attachment_type.TEXT
-                    )
+            self._attach_screenshot("social_buttons_block", self.login_page.social_buttons_block)
         else:
             allure.attach(
                 "Social buttons block 'div.socials-buttons' is not visible",
@@ -296,52 +272,29 @@ class LoginPageSteps:
         results["social_login_text"] = {"visible": social_text_visible}
         
         if social_text_visible:
-            try:
-                # Wait for element to be visible and stable before taking screenshot
-                social_text_locator = self.login_page.social_login_text
-                social_text_locator.wait_for(state="visible", timeout=10000)
-                # Take screenshot - element is already visible and stable
-                allure.attach(
-                    social_text_locator.screenshot(timeout=5000),
-                    name="social_login_text",
-                    attachment_type=allure.attachment_type.PNG
-                )
-            except Exception as e:
-                # If screenshot fails, try taking page screenshot as fallback
-                try:
-                    allure.attach(
-                        self.page.screenshot(timeout=3000),
-                        name="social_login_text_page_fallback",
-                        attachment_type=allure.attachment_type.PNG
-                    )
-                    allure.attach(
-                        f"Social login text screenshot failed, using page screenshot as fallback. Error: {str(e)}",
-                        name="social_login_text_screenshot_info",
-                        attachment_type=allure.attachment_type.TEXT
-                    )
-                except Exception:
-                    # If all screenshots fail, attach error message
-                    allure.attach(
-                        f"Social login text screenshot failed - element may not be stable. Error: {str(e)}",
-                        name="social_login_text_screenshot_failed",
-                        attachment_type=allure.attachment_type.TEXT
-                    )
+            self._attach_screenshot("social_login_text", self.login_page.social_login_text)
         
         # Verify all social login buttons
         social_buttons = self.login_page.get_all_social_login_buttons()
         social_icons = self.login_page.get_all_social_login_icons()
         
-        # Map button names to icon names
-        button_to_icon_map = {
-            "Войти с помощью GitHub": "GitHub",
-            "Войти с помощью VK": "VK",
-            "Войти с помощью Google": "Google",
-            "Войти с помощью Facebook": "Facebook",
-            "Войти с помощью Twitter": "Twitter",
-            "Войти с помощью Yandex": "Yandex"
-        }
+        # Probe all buttons and their icons inside the block in a single round-trip
+        probed = {}
+        if social_buttons_block_visible:
+            specs = {name: list(spec) for name, spec in LoginPage.SOCIAL_BUTTON_SELECTORS.items()}
+            try:
+                probed = self.login_page.social_buttons_block.first.evaluate(
+                    BATCH_PROBE_SCRIPT, specs, timeout=FAST_TIMEOUT
+                )
+            except Exception:
+                probed = {}
         
         for button_name, button_locator in social_buttons.items():
+            state = probed.get(button_name, {})
+            if state.get("visible") and state.get("enabled") and state.get("childVisible"):
+                results[button_name] = {"visible": True, "clickable": True, "icon_visible": True}
+                continue
+            # Not confirmed by the batch probe - check with Playwright's locators
             count = 0
             is_visible = False
             is_clickable = False
@@ -349,15 +302,16 @@ class LoginPageSteps:
                 # Use shorter timeout for count check to avoid long waits
                 count = button_locator.count()
                 if count > 0:
-                    is_visible = button_locator.first.is_visible(timeout=3000)
+                    first_button = button_locator.first
+                    is_visible = first_button.is_visible(timeout=3000)
                     if is_visible:
-                        is_clickable = button_locator.first.is_enabled()
+                        is_clickable = first_button.is_enabled()
             except Exception:
                 is_visible = False
                 is_clickable = False
             
             # Verify icon for this button - only check if button is visible
-            icon_name = button_to_icon_map.get(button_name, "")
+            icon_name = LoginPage.SOCIAL_BUTTON_ICONS.get(button_name, "")
             icon_visible = False
             if icon_name and icon_name in social_icons and is_visible:
                 try:
@@ -406,20 +360,7 @@ class LoginPageSteps:
         results["text_visible"] = text_visible
         
         if text_visible:
-            try:
-                # Use shorter timeout for screenshot to avoid long waits
-                allure.attach(
-                    self.login_page.registration_text.screenshot(timeout=3000),
-                    name="registration_text",
-                    attachment_type=allure.attachment_type.PNG
-                )
-            except Exception:
-                # If screenshot fails, attach a text message instead
-                allure.attach(
-                    "Registration text screenshot failed - element may not be stable",
-                    name="registration_text_screenshot_failed",
-                    attachment_type=allure.attachment_type.TEXT
-                )
+            self._attach_screenshot("registration_text", self.login_page.registration_text)
         
         # Verify registration link
         link_visible = self.login_page.verify_registration_link_exists()
@@ -429,20 +370,7 @@ class LoginPageSteps:
         results["link_clickable"] = link_clickable
         
         if link_visible:
-            try:
-                # Use shorter timeout for screenshot to avoid long waits
-                allure.attach(
-                    self.login_page.registration_link.screenshot(timeout=3000),
-                    name="registration_link",
-                    attachment_type=allure.attachment_type.PNG
-                )
-            except Exception:
-                # If screenshot fails, attach a text message instead
-                allure.attach(
-                    "Registration link screenshot failed - element may not be stable",
-                    name="registration_link_screenshot_failed",
-                    attachment_type=allure.attachment_type.TEXT
-                )
+            self._attach_screenshot("registration_link", self.login_page.registration_link)
         else:
             allure.attach(
                 "Registration link is not visible",
@@ -467,11 +395,7 @@ class LoginPageSteps:
         results["captcha_container"] = {"visible": container_visible}
         
         if container_visible:
-            allure.attach(
-                self.login_page.captcha_container.screenshot(),
-                name="captcha_container",
-                attachment_type=allure.attachment_type.PNG
-            )
+            self._attach_screenshot("captcha_container", self.login_page.captcha_container)
         else:
             allure.attach(
                 "Captcha container is not visible",
@@ -2,49 +2,276 @@
 Steps class for Main Page test actions
 Implements step-by-step actions for test execution
 """
-from pages.main_page import MainPage
-from playwright.sync_api import Page
+import os
+from types import MappingProxyType
+from typing import Dict
+from pages.main_page import MainPage, BATCH_PROBE_SCRIPT, ELEMENT_STATE_SCRIPT, FAST_TIMEOUT, SLOW_TIMEOUT
+from playwright.sync_api import Page, Locator, Error as PlaywrightError, TimeoutError as PlaywrightTimeoutError, expect
 import allure
+from utils.element_status import ElementStatus, ElementStatusMap, NOT_FOUND
+
+
+# Footer section name -> MainPage getter for that section's option locators
+_FOOTER_SECTIONS = MappingProxyType({
+    'account': MainPage.get_all_footer_options_account,
+    'sections': MainPage.get_all_footer_options_sections,
+    'information': MainPage.get_all_footer_options_information,
+    'services': MainPage.get_all_footer_options_services
+})
+
+
+# Per-step screenshots are opt-in; failures are still captured by the conftest report hook
+_SHOT = os.getenv("HABR_SCREENSHOT_ON_STEP", "0") == "1"
+
+# Cheap fingerprint of an element's markup and size, used as screenshot cache key
+_SCREENSHOT_FINGERPRINT_SCRIPT = "el => el.outerHTML.length + '_' + el.getBoundingClientRect().width"
 
 
 class MainPageSteps:
     """Steps class for Main Page test actions"""
     
-    def __init__(self, page: Page):
+    def __init__(self, page: Page, screenshot_cache: Dict[str, bytes] = None):
         """
         Initialize MainPageSteps with Playwright page object
         
         Args:
             page: Playwright Page instance
+            screenshot_cache: Optional dictionary shared across tests to reuse screenshots of unchanged static elements
         """
         self.page = page
+        self._screenshot_cache = screenshot_cache
         self.main_page = MainPage(page)
+        # Locators are lazy, so the element groups can be built once per steps instance
+        self._content_tabs = self.main_page.get_all_content_tabs()
+        self._header_elements = self.main_page.get_all_header_elements()
+        self._menu_options = self.main_page.get_all_menu_options()
+        self._service_links = self.main_page.get_all_service_links()
+        self._footer_titles = self.main_page.get_all_footer_titles()
+        self._footer_options = {
+            section_name: get_section_options(self.main_page)
+            for section_name, get_section_options in _FOOTER_SECTIONS.items()
+        }
+        self._social_icons = self.main_page.get_all_social_icons()
+        # Set once the popup banner has been closed on the current page
+        self._banner_dismissed = False
+        # URL the main page ended up on after the last navigation (None until navigated)
+        self._loaded_url = None
     
-    @allure.step("Navigate to main page")
-    def navigate_to_main_page(self) -> None:
-        """Navigate to the main page"""
-        self.main_page.navigate()
+    def _batch_probe(self, selectors, container: Locator = None) -> dict:
+        """
+        Probe visibility and enabled state of many elements in a single evaluate call
+        
+        Args:
+            selectors: Mapping of element names to (css, text) or (css, text, child_css) selectors
+            container: Element to search in (selectors are relative to it); whole page if omitted
+        
+        Returns:
+            dict: Dictionary with element names as keys and dict with 'visible' and 'enabled' as values.
+                  Empty if the probe could not run; callers then check every element with Playwright.
+        """
+        specs = {name: list(spec) for name, spec in selectors.items()}
+        try:
+            if container is None:
+                return self.page.evaluate(BATCH_PROBE_SCRIPT, specs)
+            # Container has already been waited for by the caller, don't wait for it again
+            return container.evaluate(BATCH_PROBE_SCRIPT, specs, timeout=FAST_TIMEOUT)
+        except PlaywrightError:
+            return {}
+    
+    def _sub_probe(self, probed: dict, prefix: str) -> dict:
+        """
+        Pick the entries of one group out of a combined batch probe result
+        
+        Args:
+            probed: Batch probe result whose keys are prefixed with their group (e.g. 'tab:Статьи')
+            prefix: Group prefix, including the separator
+        
+        Returns:
+            dict: Entries of the group, keyed by element name without the prefix
+        """
+        return {key[len(prefix):]: state for key, state in probed.items() if key.startswith(prefix)}
+    
+    def _probe_group(self, items: dict, probed: dict, with_clickable: bool, attach_prefix: str, label: str) -> dict:
+        """
+        Check visibility (and optionally clickability) of a group of elements
+        
+        Elements confirmed by the batch probe are taken as is, the rest are checked with their Playwright locator.
+        A text attachment is added for every element that is not visible.
+        
+        Args:
+            items: Dictionary with element names as keys and locators as values
+            probed: Batch probe result for the group (see _batch_probe)
+            with_clickable: Also check whether visible elements are clickable
+            attach_prefix: Allure attachment name prefix for missing elements
+            label: Element kind used in the missing element message (e.g. 'Menu option')
+        
+        Returns:
+            dict: Dictionary with element names as keys and visibility status as values,
+                  or ElementStatusMap with ElementStatus values if with_clickable is set
+        """
+        results = ElementStatusMap() if with_clickable else {}
+        for name, locator in items.items():
+            state = probed.get(name, {})
+            if state.get("visible") and (state.get("enabled") or not with_clickable):
+                results[name] = ElementStatus(True, True) if with_clickable else True
+                continue
+            # Not confirmed by the batch probe - check with Playwright's locator
+            count = 0
+            is_visible = False
+            is_clickable = False
+            try:
+                count = locator.count()
+                if count > 0:
+                    first = locator.first
+                    is_visible = first.is_visible()
+                    is_clickable = first.is_enabled() if with_clickable and is_visible else False
+            except PlaywrightError:
+                is_visible = False
+                is_clickable = False
+            
+            results[name] = ElementStatus(is_visible, is_clickable) if with_clickable else is_visible
+            
+            if not is_visible:
+                allure.attach(
+                    f"{label} '{name}' is not visible (count: {count})",
+                    name=f"{attach_prefix}{name}",
+                    attachment_type=allure.attachment_type.TEXT
+                )
+        
+        return results
+    
+    def _attach_screenshot(self, name: str, locator: Locator = None, cache: bool = False) -> None:
+        """
+        Attach a screenshot to the Allure report if per-step screenshots are enabled
+        
+        Args:
+            name: Attachment name
+            locator: Element to capture; the visible page is captured as JPEG if omitted
+            cache: Reuse the screenshot from the session cache if the element has not changed
+        """
+        if not _SHOT:
+            return
+        if locator is None:
+            allure.attach(
+                self.page.screenshot(type="jpeg", quality=60),
+                name=name,
+                attachment_type=allure.attachment_type.JPG
+            )
+            return
+        if cache and self._screenshot_cache is not None:
+            fingerprint = locator.evaluate(_SCREENSHOT_FINGERPRINT_SCRIPT)
+            key = f"{name}:{fingerprint}"
+            if key not in self._screenshot_cache:
+                self._screenshot_cache[key] = locator.screenshot()
+            screenshot = self._screenshot_cache[key]
+        else:
+            screenshot = locator.screenshot()
         allure.attach(
-            self.page.screenshot(),
-            name="main_page_loaded",
+            screenshot,
+            name=name,
             attachment_type=allure.attachment_type.PNG
         )
     
+    def _expect_visible(self, locator: Locator) -> bool:
+        """
+        Wait for an element to become visible using Playwright's expect()
+        
+        Used both for single elements and as a one-time gate on the parent container of a group:
+        children are probed without a timeout afterwards, so a missing child no longer
+        blocks the whole group for the full wait.
+        
+        Args:
+            locator: Locator of the element or container
+        
+        Returns:
+            bool: True if the element became visible within the timeout, False otherwise
+        """
+        try:
+            expect(locator).to_be_visible(timeout=SLOW_TIMEOUT)
+            return True
+        except AssertionError:
+            return False
+    
+    def _expect_container(self, locator: Locator, name: str) -> bool:
+        """
+        Wait for the parent container of an element group, attaching a note if it never became visible
+        
+        Args:
+            locator: Locator of the container
+            name: Container name used in the attachment
+        
+        Returns:
+            bool: True if the container became visible within the timeout, False otherwise
+        """
+        is_visible = self._expect_visible(locator)
+        if not is_visible:
+            allure.attach(
+                f"Container '{name}' is not visible, its elements are reported as missing without being checked",
+                name=f"missing_container_{name}",
+                attachment_type=allure.attachment_type.TEXT
+            )
+        return is_visible
+    
+    def _group_not_found(self, items: dict, with_clickable: bool) -> dict:
+        """
+        Results for an element group whose container is not visible: every element reads as missing
+        
+        Args:
+            items: Dictionary with element names as keys
+            with_clickable: Build ElementStatus values instead of visibility flags (see _probe_group)
+        
+        Returns:
+            dict: Same shape as the _probe_group result, with every element neither visible nor clickable
+        """
+        if with_clickable:
+            return ElementStatusMap(dict.fromkeys(items, NOT_FOUND))
+        return dict.fromkeys(items, False)
+    
+    def _reset_main_page(self) -> None:
+        """Bring an already loaded main page back to its initial state without reloading it"""
+        # Close anything a previous test left open (menu, login window)
+        self.page.keyboard.press("Escape")
+        try:
+            if self.main_page.verify_menu_panel_displayed():
+                self.main_page.menu_button.click()
+                expect(self.main_page.menu_panel).to_be_hidden(timeout=SLOW_TIMEOUT)
+            self.main_page.header_container.scroll_into_view_if_needed(timeout=SLOW_TIMEOUT)
+        except (AssertionError, PlaywrightTimeoutError):
+            # Fall back to a real reload if the menu does not close or the header cannot be reached
+            self.main_page.navigate()
+            self._loaded_url = self.page.url
+            self._banner_dismissed = False
+    
+    @allure.step("Navigate to main page")
+    def navigate_to_main_page(self) -> None:
+        """
+        Navigate to the main page
+        
+        If this steps instance already loaded the main page and the page is still there
+        (page fixtures reused with HABR_PAGE_SCOPE=session), the page is reset instead of reloaded.
+        """
+        if self._loaded_url is not None and self.page.url == self._loaded_url:
+            self._reset_main_page()
+        else:
+            self.main_page.navigate()
+            self._loaded_url = self.page.url
+            # A freshly loaded page may show the popup banner again
+            self._banner_dismissed = False
+        self._attach_screenshot("main_page_loaded")
+    
     @allure.step("Verify header container exists and is visible")
     def verify_header_container(self) -> bool:
         """
         Verify header container exists and is visible
         
+        Prefer verify_header_full when checking the whole header area.
+        
         Returns:
             bool: True if header container is visible, False otherwise
         """
-        is_visible = self.main_page.verify_header_container_exists()
+        is_visible = self._expect_visible(self.main_page.header_container)
         if is_visible:
-            allure.attach(
-                self.main_page.header_container.screenshot(),
-                name="header_container",
-                attachment_type=allure.attachment_type.PNG
-            )
+            self._attach_screenshot("header_container", self.main_page.header_container, cache=True)
         return is_visible
     
     @allure.step("Verify logo link exists and is visible")
@@ -52,6 +279,8 @@ class MainPageSteps:
         """
         Verify logo link exists and is visible
         
+        Prefer verify_header_full when checking the whole header area.
+        
         Returns:
             bool: True if logo link is visible, False otherwise
         """
@@ -62,69 +291,73 @@ class MainPageSteps:
         """
         Verify all content tabs are present and visible
         
+        Deprecated: thin wrapper over the verify_header_full probe, use verify_header_full instead.
+        
         Returns:
             dict: Dictionary with tab names as keys and visibility status as values
         """
-        tabs = {
-            "Статьи": self.main_page.articles_tab,
-            "Посты": self.main_page.posts_tab,
-            "Новости": self.main_page.news_tab,
-            "Хабы": self.main_page.hubs_tab,
-            "Авторы": self.main_page.authors_tab,
-            "Компании": self.main_page.companies_tab
-        }
-        
-        results = {}
-        for tab_name, tab_locator in tabs.items():
-            try:
-                # Check if element exists and is visible
-                count = tab_locator.count()
-                if count > 0:
-                    is_visible = tab_locator.first.is_visible(timeout=5000)
-                else:
-                    is_visible = False
-            except Exception:
-                is_visible = False
-            
-            results[tab_name] = is_visible
-            if not is_visible:
-                allure.attach(
-                    f"Tab '{tab_name}' is not visible (count: {tab_locator.count() if 'tab_locator' in locals() else 0})",
-                    name=f"missing_tab_{tab_name}",
-                    attachment_type=allure.attachment_type.TEXT
-                )
-        
-        return results
+        return self._probe_header_area()["tabs"]
     
     @allure.step("Verify header elements are present and visible")
     def verify_header_elements(self) -> dict:
         """
         Verify header elements (All Streams, Search, Write Publication, Settings, Login) are visible
         
+        Deprecated: thin wrapper over the verify_header_full probe, use verify_header_full instead.
+        
         Returns:
             dict: Dictionary with element names as keys and visibility status as values
         """
-        elements = {
-            "Все потоки": self.main_page.all_streams_link,
-            "Поиск": self.main_page.search_link,
-            "Написать публикацию": self.main_page.write_publication_link,
-            "Настройки": self.main_page.settings_button,
-            "Войти": self.main_page.login_button
-        }
+        return self._probe_header_area()["header_elements"]
+    
+    @allure.step("Verify header container, logo, content tabs and header elements")
+    def verify_header_full(self) -> dict:
+        """
+        Verify the whole header area with a single batch probe and a single report step
         
-        results = {}
-        for element_name, element_locator in elements.items():
-            is_visible = element_locator.is_visible()
-            results[element_name] = is_visible
-            if not is_visible:
-                allure.attach(
-                    f"Element '{element_name}' is not visible",
-                    name=f"missing_element_{element_name}",
-                    attachment_type=allure.attachment_type.TEXT
-                )
+        Combines verify_header_container, verify_logo_link, verify_all_content_tabs and
+        verify_header_elements; elements the probe cannot confirm are re-checked with Playwright.
         
+        Returns:
+            dict: Dictionary with 'header_container' and 'logo' visibility status, and 'tabs' and
+                  'header_elements' dicts with element names as keys and visibility status as values
+        """
+        results = self._probe_header_area()
+        if results["header_container"]:
+            self._attach_screenshot("header_container", self.main_page.header_container, cache=True)
         return results
     
+    def _probe_header_area(self) -> dict:
+        """
+        Probe the logo, content tabs and header elements in one batch probe (see verify_header_full)
+        
+        Returns:
+            dict: Same structure as the verify_header_full result
+        """
+        if not self._expect_container(self.main_page.header_container, "header_container"):
+            return {
+                "header_container": False,
+                "logo": False,
+                "tabs": self._group_not_found(self._content_tabs, False),
+                "header_elements": self._group_not_found(self._header_elements, False)
+            }
+        selectors = {"logo": MainPage.LOGO_SELECTOR}
+        selectors.update({f"tab:{name}": spec for name, spec in MainPage.CONTENT_TAB_SELECTORS.items()})
+        selectors.update({f"element:{name}": spec for name, spec in MainPage.HEADER_ELEMENT_SELECTORS.items()})
+        probed = self._batch_probe(selectors)
+        
+        logo = self._probe_group({"logo": self.main_page.logo_link}, probed, False, "missing_", "Element")
+        return {
+            "header_container": True,
+            "logo": logo["logo"],
+            "tabs": self._probe_group(
+                self._content_tabs, self._sub_probe(probed, "tab:"), False, "missing_tab_", "Tab"
+            ),
+            "header_elements": self._probe_group(
+                self._header_elements, self._sub_probe(probed, "element:"), False, "missing_element_", "Element"
+            )
+        }
+    
     @allure.step("Verify main content area exists and is visible")
     def verify_main_content_area(self) -> bool:
         """
@@ -133,13 +366,10 @@ class MainPageSteps:
         Returns:
             bool: True if main content area is visible, False otherwise
         """
-        is_visible = self.main_page.verify_main_content_area_exists()
+        content_area = self.main_page.main_content_area.first
+        is_visible = self._expect_visible(content_area)
         if is_visible:
-            allure.attach(
-                self.main_page.main_content_area.first.screenshot(),
-                name="main_content_area",
-                attachment_type=allure.attachment_type.PNG
-            )
+            self._attach_screenshot("main_content_area", content_area)
         return is_visible
     
     @allure.step("Verify footer section exists and is visible")
@@ -150,18 +380,16 @@ class MainPageSteps:
         Returns:
             bool: True if footer section is visible, False otherwise
         """
-        # Scroll to footer to ensure it's visible
-        self.page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-        # Wait for footer to be visible instead of fixed timeout
-        self.main_page.footer_section.first.wait_for(state="visible", timeout=5000)
+        # Scroll footer into view; this also waits for it to be visible, so success means visible
+        footer = self.main_page.footer_section.first
+        try:
+            footer.scroll_into_view_if_needed(timeout=SLOW_TIMEOUT)
+            is_visible = True
+        except PlaywrightTimeoutError:
+            is_visible = False
         
-        is_visible = self.main_page.verify_footer_section_exists()
         if is_visible:
-            allure.attach(
-                self.main_page.footer_section.first.screenshot(),
-                name="footer_section",
-                attachment_type=allure.attachment_type.PNG
-            )
+            self._attach_screenshot("footer_section", footer, cache=True)
         return is_visible
     
     # Menu-related steps
@@ -173,15 +401,13 @@ class MainPageSteps:
         Returns:
             dict: Dictionary with 'exists' and 'clickable' status
         """
-        exists = self.main_page.verify_menu_button_exists()
-        clickable = self.main_page.verify_menu_button_clickable() if exists else False
+        state = self.main_page.menu_button_state()
+        # 'exists' has always meant present and visible for this step
+        exists = state["visible"]
+        clickable = exists and state["enabled"]
         
         if exists:
-            allure.attach(
-                self.main_page.menu_button.screenshot(),
-                name="menu_button",
-                attachment_type=allure.attachment_type.PNG
-            )
+            self._attach_screenshot("menu_button", self.main_page.menu_button)
         
         return {"exists": exists, "clickable": clickable}
     
@@ -189,26 +415,16 @@ class MainPageSteps:
     def open_menu(self) -> None:
         """Open the menu by clicking the menu button"""
         self.main_page.menu_button.click()
-        # Wait for menu to open by waiting for a menu option to appear
-        # Try waiting for menu panel first, if that fails, wait for a menu option
-        try:
-            self.main_page.menu_panel.wait_for(state="visible", timeout=5000)
-        except Exception:
-            # If menu panel wait fails, wait for a menu option instead
-            try:
-                self.main_page.menu_whats_new.wait_for(state="visible", timeout=5000)
-            except Exception:
-                # If that also fails, try waiting for any menu option to appear
-                try:
-                    self.main_page.menu_backend.wait_for(state="visible", timeout=5000)
-                except Exception:
-                    # If all menu options fail, wait for services section header
-                    self.main_page.services_section_header.wait_for(state="visible", timeout=5000)
-        allure.attach(
-            self.page.screenshot(),
-            name="menu_opened",
-            attachment_type=allure.attachment_type.PNG
-        )
+        # Wait once for any sign of the open menu to become visible. The union matches in DOM order,
+        # so it is narrowed to visible elements first; otherwise .first would always be the panel node
+        self.main_page.menu_panel.or_(
+            self.main_page.menu_whats_new
+        ).or_(
+            self.main_page.menu_backend
+        ).or_(
+            self.main_page.services_section_header
+        ).locator("visible=true").first.wait_for(state="visible", timeout=SLOW_TIMEOUT)
+        self._attach_screenshot("menu_opened")
     
     @allure.step("Verify menu panel is displayed")
     def verify_menu_panel_displayed(self) -> bool:
@@ -218,29 +434,20 @@ class MainPageSteps:
         Returns:
             bool: True if menu panel is visible, False otherwise
         """
-        # Check if menu panel is visible, or if any menu option is visible as fallback
-        is_visible = self.main_page.verify_menu_panel_displayed()
-        if not is_visible:
-            # If menu panel is not visible, check if menu options are visible
-            try:
-                is_visible = self.main_page.menu_whats_new.is_visible(timeout=2000)
-            except Exception:
-                is_visible = False
+        # Menu panel or, as a fallback, its first menu option (narrowed to visible matches, see open_menu)
+        try:
+            is_visible = self.main_page.menu_panel.or_(
+                self.main_page.menu_whats_new
+            ).locator("visible=true").first.is_visible()
+        except PlaywrightError:
+            is_visible = False
         
         if is_visible:
             try:
-                allure.attach(
-                    self.main_page.menu_panel.screenshot(),
-                    name="menu_panel",
-                    attachment_type=allure.attachment_type.PNG
-                )
-            except Exception:
+                self._attach_screenshot("menu_panel", self.main_page.menu_panel)
+            except PlaywrightError:
                 # If menu panel screenshot fails, use page screenshot
-                allure.attach(
-                    self.page.screenshot(),
-                    name="menu_panel",
-                    attachment_type=allure.attachment_type.PNG
-                )
+                self._attach_screenshot("menu_panel")
         return is_visible
     
     @allure.step("Verify all main menu options are displayed")
@@ -249,37 +456,10 @@ class MainPageSteps:
         Verify all main menu options are present, visible, and clickable
         
         Returns:
-            dict: Dictionary with menu option names as keys and dict with 'visible' and 'clickable' as values
+            ElementStatusMap: Dictionary with menu option names as keys and ElementStatus as values
         """
-        menu_options = self.main_page.get_all_menu_options()
-        results = {}
-        
-        for option_name, option_locator in menu_options.items():
-            try:
-                count = option_locator.count()
-                if count > 0:
-                    is_visible = option_locator.first.is_visible(timeout=5000)
-                    is_clickable = option_locator.first.is_enabled() if is_visible else False
-                else:
-                    is_visible = False
-                    is_clickable = False
-            except Exception:
-                is_visible = False
-                is_clickable = False
-            
-            results[option_name] = {
-                "visible": is_visible,
-                "clickable": is_clickable
-            }
-            
-            if not is_visible:
-                allure.attach(
-                    f"Menu option '{option_name}' is not visible (count: {count if 'count' in locals() else 0})",
-                    name=f"missing_menu_option_{option_name}",
-                    attachment_type=allure.attachment_type.TEXT
-                )
-        
-        return results
+        probed = self._batch_probe(MainPage.MENU_OPTION_SELECTORS, self.main_page.menu_options_container)
+        return self._probe_group(self._menu_options, probed, True, "missing_menu_option_", "Menu option")
     
     @allure.step("Verify 'Все сервисы Хабра' section is displayed")
     def verify_services_section(self) -> dict:
@@ -293,49 +473,20 @@ class MainPageSteps:
         
         # Verify section header
         try:
-            header_visible = self.main_page.services_section_header.is_visible(timeout=5000)
-        except Exception:
+            header_visible = self.main_page.services_section_header.is_visible()
+        except PlaywrightError:
             header_visible = False
         
         results["section_header"] = header_visible
         
         # Verify service links
-        service_links = self.main_page.get_all_service_links()
-        service_results = {}
-        
-        for service_name, service_locator in service_links.items():
-            try:
-                count = service_locator.count()
-                if count > 0:
-                    is_visible = service_locator.first.is_visible(timeout=5000)
-                    is_clickable = service_locator.first.is_enabled() if is_visible else False
-                else:
-                    is_visible = False
-                    is_clickable = False
-            except Exception:
-                is_visible = False
-                is_clickable = False
-            
-            service_results[service_name] = {
-                "visible": is_visible,
-                "clickable": is_clickable
-            }
-            
-            if not is_visible:
-                allure.attach(
-                    f"Service link '{service_name}' is not visible (count: {count if 'count' in locals() else 0})",
-                    name=f"missing_service_link_{service_name}",
-                    attachment_type=allure.attachment_type.TEXT
-                )
-        
-        results["service_links"] = service_results
+        probed = self._batch_probe(MainPage.SERVICE_LINK_SELECTORS, self.main_page.menu_options_container)
+        results["service_links"] = self._probe_group(
+            self._service_links, probed, True, "missing_service_link_", "Service link"
+        )
         
         if header_visible:
-            allure.attach(
-                self.main_page.services_section_header.screenshot(),
-                name="services_section_header",
-                attachment_type=allure.attachment_type.PNG
-            )
+            self._attach_screenshot("services_section_header", self.main_page.services_section_header)
         
         return results
     
@@ -343,33 +494,12 @@ class MainPageSteps:
     def close_menu(self) -> None:
         """Close the menu by clicking the menu button again"""
         self.main_page.menu_button.click()
-        # Wait for menu panel to be hidden
+        # Wait for menu panel to be hidden; verify_menu_panel_hidden reports if it is not
         try:
-            self.main_page.menu_panel.wait_for(state="hidden", timeout=5000)
-        except Exception:
-            # If menu panel wait fails, check if menu panel is actually hidden by checking visibility
-            try:
-                # Check if menu panel is not visible (hidden)
-                if not self.main_page.menu_panel.is_visible(timeout=2000):
-                    # Menu panel is hidden
-                    pass
-                else:
-                    # Menu panel is still visible, wait for it to become hidden
-                    self.main_page.menu_panel.wait_for(state="hidden", timeout=3000)
-            except Exception:
-                # If menu panel check fails, verify menu button is still visible and enabled
-                # (menu button should be visible when menu is closed)
-                try:
-                    self.main_page.menu_button.wait_for(state="visible", timeout=2000)
-                    # Menu button is visible, which indicates menu is likely closed
-                except Exception:
-                    # If all checks fail, menu is likely closed (button might be in different state)
-                    pass
-        allure.attach(
-            self.page.screenshot(),
-            name="menu_closed",
-            attachment_type=allure.attachment_type.PNG
-        )
+            expect(self.main_page.menu_panel).to_be_hidden(timeout=SLOW_TIMEOUT)
+        except AssertionError:
+            pass
+        self._attach_screenshot("menu_closed")
     
     @allure.step("Verify menu panel is hidden")
     def verify_menu_panel_hidden(self) -> bool:
@@ -379,48 +509,19 @@ class MainPageSteps:
         Returns:
             bool: True if menu panel is hidden, False otherwise
         """
-        # Check if menu panel is hidden
-        is_hidden = self.main_page.verify_menu_panel_hidden()
-        # If menu panel check fails, check if menu panel is actually hidden now
-        if not is_hidden:
-            # Wait for menu panel to become hidden
-            try:
-                self.main_page.menu_panel.wait_for(state="hidden", timeout=3000)
-                is_hidden = True
-            except Exception:
-                # If menu panel wait fails, check visibility directly
-                try:
-                    # Check if menu panel is not visible (hidden)
-                    is_hidden = not self.main_page.menu_panel.is_visible(timeout=2000)
-                except Exception:
-                    # If we can't check menu panel visibility, verify menu button state
-                    # (menu button should be visible when menu is closed)
-                    try:
-                        button_visible = self.main_page.menu_button.is_visible(timeout=2000)
-                        button_clickable = self.main_page.menu_button.is_enabled()
-                        if button_visible and button_clickable:
-                            # Menu button is visible and clickable, menu is likely closed
-                            # (menu panel might still exist in DOM but not visible)
-                            is_hidden = True
-                        else:
-                            is_hidden = False
-                    except Exception:
-                        # If we can't check button, assume menu is closed
-                        is_hidden = True
-        return is_hidden
+        try:
+            expect(self.main_page.menu_panel).to_be_hidden(timeout=SLOW_TIMEOUT)
+            return True
+        except AssertionError:
+            return False
     
     # Footer-related steps
     @allure.step("Scroll to footer")
     def scroll_to_footer(self) -> None:
         """Scroll to the bottom of the page to ensure footer is visible"""
-        self.page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-        # Wait for footer section to be visible (explicit wait)
-        self.main_page.footer_section_main.wait_for(state="visible", timeout=5000)
-        allure.attach(
-            self.page.screenshot(),
-            name="scrolled_to_footer",
-            attachment_type=allure.attachment_type.PNG
-        )
+        # Scroll footer section into view; this also waits for it to be visible
+        self.main_page.footer_section_main.scroll_into_view_if_needed(timeout=SLOW_TIMEOUT)
+        self._attach_screenshot("scrolled_to_footer")
     
     @allure.step("Verify footer menu container exists and is visible")
     def verify_footer_menu_container(self) -> bool:
@@ -432,11 +533,7 @@ class MainPageSteps:
         """
         is_visible = self.main_page.verify_footer_menu_container_exists()
         if is_visible:
-            allure.attach(
-                self.main_page.footer_menu_container.screenshot(),
-                name="footer_menu_container",
-                attachment_type=allure.attachment_type.PNG
-            )
+            self._attach_screenshot("footer_menu_container", self.main_page.footer_menu_container)
         return is_visible
     
     @allure.step("Verify all footer menu titles are displayed")
@@ -447,29 +544,10 @@ class MainPageSteps:
         Returns:
             dict: Dictionary with title names as keys and visibility status as values
         """
-        titles = self.main_page.get_all_footer_titles()
-        results = {}
-        
-        for title_name, title_locator in titles.items():
-            try:
-                count = title_locator.count()
-                if count > 0:
-                    is_visible = title_locator.first.is_visible(timeout=5000)
-                else:
-                    is_visible = False
-            except Exception:
-                is_visible = False
-            
-            results[title_name] = is_visible
-            
-            if not is_visible:
-                allure.attach(
-                    f"Footer title '{title_name}' is not visible (count: {count if 'count' in locals() else 0})",
-                    name=f"missing_footer_title_{title_name}",
-                    attachment_type=allure.attachment_type.TEXT
-                )
-        
-        return results
+        if not self._expect_container(self.main_page.footer_menu_container, "footer_menu_container"):
+            return self._group_not_found(self._footer_titles, False)
+        probed = self._batch_probe(MainPage.FOOTER_TITLE_SELECTORS)
+        return self._probe_group(self._footer_titles, probed, False, "missing_footer_title_", "Footer title")
     
     @allure.step("Verify footer menu options are displayed and clickable")
     def verify_footer_options(self, section_name: str) -> dict:
@@ -480,44 +558,46 @@ class MainPageSteps:
             section_name: Name of the section ('account', 'sections', 'information', 'services')
         
         Returns:
-            dict: Dictionary with option names as keys and dict with 'visible' and 'clickable' as values
+            ElementStatusMap: Dictionary with option names as keys and ElementStatus as values
+        """
+        if not self._expect_container(self.main_page.footer_menu_container, "footer_menu_container"):
+            return self._group_not_found(self._footer_options.get(section_name, {}), True)
+        probed = self._batch_probe(MainPage.FOOTER_OPTION_SELECTORS.get(section_name, {}))
+        return self._probe_group(
+            self._footer_options.get(section_name, {}), probed, True,
+            f"missing_footer_option_{section_name}_", "Footer option"
+        )
+    
+    @allure.step("Verify footer menu options of all sections are displayed and clickable")
+    def verify_footer_options_bulk(self, section_names: tuple = tuple(_FOOTER_SECTIONS)) -> dict:
         """
-        section_map = {
-            'account': self.main_page.get_all_footer_options_account(),
-            'sections': self.main_page.get_all_footer_options_sections(),
-            'information': self.main_page.get_all_footer_options_information(),
-            'services': self.main_page.get_all_footer_options_services()
-        }
+        Verify footer menu options for several sections with a single batch probe
         
-        options = section_map.get(section_name, {})
-        results = {}
+        Args:
+            section_names: Names of the sections (see verify_footer_options), all four by default
         
-        for option_name, option_locator in options.items():
-            try:
-                count = option_locator.count()
-                if count > 0:
-                    is_visible = option_locator.first.is_visible(timeout=5000)
-                    is_clickable = option_locator.first.is_enabled() if is_visible else False
-                else:
-                    is_visible = False
-                    is_clickable = False
-            except Exception:
-                is_visible = False
-                is_clickable = False
-            
-            results[option_name] = {
-                "visible": is_visible,
-                "clickable": is_clickable
+        Returns:
+            dict: Dictionary with section names as keys and verify_footer_options results as values
+        """
+        if not self._expect_container(self.main_page.footer_menu_container, "footer_menu_container"):
+            return {
+                section_name: self._group_not_found(self._footer_options.get(section_name, {}), True)
+                for section_name in section_names
             }
-            
-            if not is_visible:
-                allure.attach(
-                    f"Footer option '{option_name}' is not visible (count: {count if 'count' in locals() else 0})",
-                    name=f"missing_footer_option_{section_name}_{option_name}",
-                    attachment_type=allure.attachment_type.TEXT
-                )
+        selectors = {
+            f"{section_name}:{option_name}": spec
+            for section_name in section_names
+            for option_name, spec in MainPage.FOOTER_OPTION_SELECTORS.get(section_name, {}).items()
+        }
+        probed = self._batch_probe(selectors)
         
-        return results
+        return {
+            section_name: self._probe_group(
+                self._footer_options.get(section_name, {}), self._sub_probe(probed, f"{section_name}:"), True,
+                f"missing_footer_option_{section_name}_", "Footer option"
+            )
+            for section_name in section_names
+        }
     
     @allure.step("Verify footer section is displayed")
     def verify_footer_section_main(self) -> bool:
@@ -527,13 +607,9 @@ class MainPageSteps:
         Returns:
             bool: True if footer section is visible, False otherwise
         """
-        is_visible = self.main_page.footer_section_main.is_visible()
+        is_visible = self._expect_visible(self.main_page.footer_section_main)
         if is_visible:
-            allure.attach(
-                self.main_page.footer_section_main.screenshot(),
-                name="footer_section_main",
-                attachment_type=allure.attachment_type.PNG
-            )
+            self._attach_screenshot("footer_section_main", self.main_page.footer_section_main)
         return is_visible
     
     @allure.step("Close popup banner if present")
@@ -541,21 +617,24 @@ class MainPageSteps:
         """
         Close popup banner if it is present and visible
         
-        The banner has locator 'div.fixed-banner-wrapper' and close button has locator 'button.close-button'
+        The banner has locator 'div.fixed-banner-wrapper' and close button has locator 'button.close-button'.
+        Once the banner has been closed, further calls return immediately until the next navigation.
         """
+        if self._banner_dismissed:
+            return
         try:
-            banner = self.page.locator('div.fixed-banner-wrapper')
-            if banner.is_visible(timeout=3000):
-                close_button = self.page.locator('button.close-button')
-                if close_button.is_visible(timeout=2000):
+            banner = self.main_page.banner
+            if banner.is_visible():
+                close_button = self.main_page.banner_close
+                if close_button.is_visible():
                     close_button.click()
                     # Wait for banner to be hidden
                     try:
                         banner.wait_for(state="hidden", timeout=3000)
+                        self._banner_dismissed = True
                     except Exception:
                         # If wait fails, check if banner is actually hidden
-                        if not banner.is_visible(timeout=1000):
-                            pass  # Banner is hidden
+                        self._banner_dismissed = not banner.is_visible()
                 allure.attach(
                     "Popup banner was closed successfully",
                     name="banner_closed",
@@ -577,21 +656,13 @@ class MainPageSteps:
         Returns:
             bool: True if copyright text is visible, False otherwise
         """
-        try:
-            is_visible = self.main_page.footer_copyright_text.is_visible(timeout=5000)
-        except Exception:
-            is_visible = False
-        
+        is_visible = self._expect_visible(self.main_page.footer_copyright_text)
         if is_visible:
-            allure.attach(
-                self.main_page.footer_copyright_text.screenshot(),
-                name="copyright_text",
-                attachment_type=allure.attachment_type.PNG
-            )
+            self._attach_screenshot("copyright_text", self.main_page.footer_copyright_text, cache=True)
         return is_visible
     
     @allure.step("Verify footer link is displayed and clickable")
-    def verify_footer_link(self, link_name: str) -> dict:
+    def verify_footer_link(self, link_name: str) -> ElementStatus:
         """
         Verify a footer link is displayed and clickable
         
@@ -599,7 +670,7 @@ class MainPageSteps:
             link_name: Name of the link ('support' or 'language')
         
         Returns:
-            dict: Dictionary with 'visible' and 'clickable' status
+            ElementStatus: Visibility and clickability of the link
         """
         link_map = {
             'support': self.main_page.footer_support_link,
@@ -608,28 +679,22 @@ class MainPageSteps:
         
         link_locator = link_map.get(link_name)
         if not link_locator:
-            return {"visible": False, "clickable": False}
+            return NOT_FOUND
         
+        first = link_locator.first
+        # Visibility and enabled state in a single round-trip; fails if the link is not there
         try:
-            count = link_locator.count()
-            if count > 0:
-                is_visible = link_locator.first.is_visible(timeout=5000)
-                is_clickable = link_locator.first.is_enabled() if is_visible else False
-            else:
-                is_visible = False
-                is_clickable = False
-        except Exception:
+            state = first.evaluate(ELEMENT_STATE_SCRIPT, timeout=FAST_TIMEOUT)
+            is_visible = state["visible"]
+            is_clickable = is_visible and state["enabled"]
+        except PlaywrightError:
             is_visible = False
             is_clickable = False
         
         if is_visible:
-            allure.attach(
-                link_locator.first.screenshot(),
-                name=f"footer_link_{link_name}",
-                attachment_type=allure.attachment_type.PNG
-            )
+            self._attach_screenshot(f"footer_link_{link_name}", first)
         
-        return {"visible": is_visible, "clickable": is_clickable}
+        return ElementStatus(is_visible, is_clickable)
     
     @allure.step("Verify social-icons section is displayed")
     def verify_social_icons_section(self) -> bool:
@@ -639,7 +704,7 @@ class MainPageSteps:
         Returns:
             bool: True if social-icons section is visible (at least one icon found), False otherwise
         """
-        icons = self.main_page.get_all_social_icons()
+        icons = self._social_icons
         is_visible = False
         
         # Check if at least one social icon is visible
@@ -647,21 +712,17 @@ class MainPageSteps:
             try:
                 count = icon_locator.count()
                 if count > 0:
-                    if icon_locator.first.is_visible(timeout=2000):
+                    if icon_locator.first.is_visible():
                         is_visible = True
                         # Take screenshot of the entire social icons block
                         try:
                             social_icons_section = self.page.locator('div.social-icons.tm-footer__social')
-                            if social_icons_section.is_visible(timeout=2000):
-                                allure.attach(
-                                    social_icons_section.screenshot(),
-                                    name="social_icons_section",
-                                    attachment_type=allure.attachment_type.PNG
-                                )
-                        except Exception:
+                            if _SHOT and social_icons_section.is_visible():
+                                self._attach_screenshot("social_icons_section", social_icons_section)
+                        except PlaywrightError:
                             pass
                         break
-            except Exception:
+            except PlaywrightError:
                 continue
         
         return is_visible
@@ -672,35 +733,10 @@ class MainPageSteps:
         Verify all social icons are displayed and clickable
         
         Returns:
-            dict: Dictionary with icon names as keys and dict with 'visible' and 'clickable' as values
+            ElementStatusMap: Dictionary with icon names as keys and ElementStatus as values
         """
-        icons = self.main_page.get_all_social_icons()
-        results = {}
-        
-        for icon_name, icon_locator in icons.items():
-            try:
-                count = icon_locator.count()
-                if count > 0:
-                    is_visible = icon_locator.first.is_visible(timeout=5000)
-                    is_clickable = icon_locator.first.is_enabled() if is_visible else False
-                else:
-                    is_visible = False
-                    is_clickable = False
-            except Exception:
-                is_visible = False
-                is_clickable = False
-            
-            results[icon_name] = {
-                "visible": is_visible,
-                "clickable": is_clickable
-            }
-            
-            if not is_visible:
-                allure.attach(
-                    f"Social icon '{icon_name}' is not visible (count: {count if 'count' in locals() else 0})",
-                    name=f"missing_social_icon_{icon_name}",
-                    attachment_type=allure.attachment_type.TEXT
-                )
-        
-        return results
+        if not self._expect_container(self.main_page.footer_section_main, "footer_section_main"):
+            return self._group_not_found(self._social_icons, True)
+        probed = self._batch_probe(MainPage.SOCIAL_ICON_SELECTORS, self.main_page.social_icons_container)
+        return self._probe_group(self._social_icons, probed, True, "missing_social_icon_", "Social icon")
 
@@ -0,0 +1,60 @@
+"""
+Assertion helpers for element group checks
+Lists of failed elements are built only when a check fails
+"""
+from typing import Dict
+
+from utils.element_status import ElementStatus
+
+
+# Status of an element that passed both checks
+_ALL_OK = ElementStatus(True, True)
+
+
+def assert_all_visible(results: Dict[str, bool], expected: tuple, label: str, kind: str) -> None:
+    """
+    Assert that every expected element of a group is visible
+    
+    Args:
+        results: Dictionary with element names as keys and visibility status as values
+        expected: Expected element names
+        label: Group name used in the failure message (e.g. 'content tabs')
+        kind: Short element kind used in the failure message (e.g. 'tabs')
+    """
+    if all(results.get(name, False) for name in expected):
+        return
+    missing = [name for name in expected if not results.get(name, False)]
+    raise AssertionError(
+        f"Some {label} are missing or not visible: {missing}. "
+        f"All {kind} should be present: {expected}"
+    )
+
+
+def assert_all_clickable(results: Dict[str, ElementStatus], expected: tuple, label: str, kind: str) -> None:
+    """
+    Assert that every expected element of a group is visible and clickable
+    
+    Args:
+        results: ElementStatusMap with element names as keys (see MainPageSteps._probe_group)
+        expected: Expected element names
+        label: Group name used in the failure message (e.g. 'menu options')
+        kind: Short element kind used in the failure message (e.g. 'options')
+    """
+    if all(results[name] == _ALL_OK for name in expected):
+        return
+    missing, not_clickable = [], []
+    for name in expected:
+        status = results[name]
+        if not status.visible:
+            missing.append(name)
+        elif not status.clickable:
+            not_clickable.append(name)
+    if missing:
+        raise AssertionError(
+            f"Some {label} are missing or not visible: {missing}. "
+            f"All {kind} should be present: {expected}"
+        )
+    raise AssertionError(
+        f"Some {label} are not clickable: {not_clickable}. "
+        f"All visible {kind} should be clickable"
+    )
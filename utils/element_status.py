@@ -0,0 +1,21 @@
+"""
+Element status types shared by the steps classes and assertion helpers
+"""
+from typing import NamedTuple
+
+
+class ElementStatus(NamedTuple):
+    """Visibility and clickability of a single element"""
+    visible: bool
+    clickable: bool
+
+
+# Status of an element a group result has no entry for
+NOT_FOUND = ElementStatus(False, False)
+
+
+class ElementStatusMap(dict):
+    """Element name -> ElementStatus; unknown names read as neither visible nor clickable"""
+    
+    def __missing__(self, key: str) -> ElementStatus:
+        return NOT_FOUND